@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Section 1_3 Rule Priority Testing
+Runs the Section 1_3 arrow replacement / line strike / handwriting append rules on small
+generated Word documents (no PDF or GPT-4o analysis needed) and checks the edited text.
+
+- A paragraph can take several rules (an arrow replacement and then a handwriting append)
+- A strike that matches nothing does not stop the other rules
+- Each struck paragraph is deleted once, even when several strikes match it
+"""
+
+import os
+import sys
+from docx import Document
+
+# Import the Word processing module directly (the core package also loads the PDF/vision modules)
+core_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
+sys.path.insert(0, core_dir)
+
+from unified_section_implementations import UnifiedSectionImplementations
+
+
+class Section1_3RulesTester:
+    def __init__(self):
+        self.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "section_1_3_rules_test")
+        self.implementations = UnifiedSectionImplementations(os.path.join(self.output_dir, "base.docx"), self.output_dir)
+
+    def create_document(self, paragraphs: list) -> Document:
+        """Create a Word document with one body paragraph per text"""
+        doc = Document()
+        for text in paragraphs:
+            doc.add_paragraph(text)
+        return doc
+
+    def handwriting_analysis(self, item_text: str, handwriting: str) -> dict:
+        """Analysis with one handwritten note after item_text in the left box"""
+        return {
+            "left_box_analysis": {
+                "has_interruptions": True,
+                "interrupted_items": [{
+                    "item_text": item_text,
+                    "interruption_type": "handwritten notes",
+                    "interruption_description": f"Handwritten text: '{handwriting}'",
+                    "should_delete": False
+                }]
+            }
+        }
+
+    def check(self, description: str, actual, expected) -> bool:
+        if actual == expected:
+            print(f"   ✅ {description}")
+            return True
+        print(f"   ❌ {description}: expected {expected!r}, got {actual!r}")
+        return False
+
+    def arrow_replacement(self, original_text: str, replacement_text: str) -> dict:
+        return {
+            "has_arrow_replacements": True,
+            "arrow_replacement_details": [{"should_replace": True, "original_text": original_text, "replacement_text": replacement_text}]
+        }
+
+    def test_replacement_then_append(self) -> bool:
+        """The replaced paragraph still takes the handwriting appended after its sentence"""
+        doc = self.create_document(["Review the portfolio annually", "Other"])
+        analysis = self.handwriting_analysis("Review the portfolio", "soon")
+        analysis["arrow_replacement"] = self.arrow_replacement("annually", "yearly")
+        changes = self.implementations.implement_section_1_3(doc, analysis)
+        return (self.check("Changes", [change["type"] for change in changes], ["arrow_replacement", "handwriting_append"]) and
+                self.check("Paragraphs", [para.text for para in doc.paragraphs], ["Review the portfolio yearly. soon", "Other"]))
+
+    def test_all_rules_in_one_pass(self) -> bool:
+        """A strike that matches nothing does not stop the other strikes, replacements or appends"""
+        doc = self.create_document(["Review the portfolio annually", "Other"])
+        analysis = self.handwriting_analysis("Review the portfolio", "soon")
+        analysis["arrow_replacement"] = self.arrow_replacement("annually", "yearly")
+        analysis["line_strike"] = {
+            "has_line_strikes": True,
+            "line_strike_details": [
+                {"should_delete": True, "text_content": "Absent text"},
+                {"should_delete": True, "text_content": "Other"}
+            ]
+        }
+        changes = self.implementations.implement_section_1_3(doc, analysis)
+        return (self.check("Changes", [change["type"] for change in changes], ["arrow_replacement", "line_strike", "handwriting_append"]) and
+                self.check("Paragraphs", [para.text for para in doc.paragraphs], ["Review the portfolio yearly. soon"]))
+
+    def test_overlapping_strikes(self) -> bool:
+        """Two strikes matching the same paragraph delete it once; each applied strike is reported"""
+        doc = self.create_document(["alpha beta", "beta only", "gamma"])
+        analysis = {
+            "line_strike": {
+                "has_line_strikes": True,
+                "line_strike_details": [
+                    {"should_delete": True, "text_content": "alpha"},
+                    {"should_delete": True, "text_content": "beta"}
+                ]
+            }
+        }
+        changes = self.implementations.implement_section_1_3(doc, analysis)
+        return (self.check("Both strikes reported", [change["type"] for change in changes], ["line_strike", "line_strike"]) and
+                self.check("Remaining paragraphs", [para.text for para in doc.paragraphs], ["gamma"]))
+
+    def run_test(self) -> bool:
+        print(f"🧪 Section 1_3 rule priority test")
+        results = []
+        for test in (self.test_replacement_then_append, self.test_all_rules_in_one_pass, self.test_overlapping_strikes):
+            print(f"🔍 {test.__doc__}")
+            results.append(test())
+        passed = sum(results)
+        print(f"\n📊 {passed}/{len(results)} checks passed")
+        return passed == len(results)
+
+
+def main():
+    """Run Section 1_3 rule priority test"""
+    tester = Section1_3RulesTester()
+    success = tester.run_test()
+    print(f"Section 1_3 rule test {'completed successfully' if success else 'failed'}")
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Section 4_1 Two-Part Rules Testing
+Runs the Section 4_1 two-part right box rules on a small generated Word table (no PDF or
+GPT-4o analysis needed) and checks the combined Part 1 and Part 2 edits.
+
+- A Part 1 strike is retried with the text left by a Part 2 replacement
+"""
+
+import os
+import sys
+from docx import Document
+
+# Import the Word processing module directly (the core package also loads the PDF/vision modules)
+core_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
+sys.path.insert(0, core_dir)
+
+from unified_section_implementations import UnifiedSectionImplementations
+
+
+class Section4_1PartsTester:
+    def __init__(self):
+        self.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "section_4_1_parts_test")
+        self.implementations = UnifiedSectionImplementations(os.path.join(self.output_dir, "base.docx"), self.output_dir)
+
+    def check(self, description: str, actual, expected) -> bool:
+        if actual == expected:
+            print(f"   ✅ {description}")
+            return True
+        print(f"   ❌ {description}: expected {expected!r}, got {actual!r}")
+        return False
+
+    def test_strike_after_replacement(self) -> bool:
+        """A Part 1 strike is retried with the text left by a Part 2 replacement"""
+        doc = Document()
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(1, 0).text = "Pay off debt"
+        right = table.cell(1, 1)
+        right.text = "Moved funds to offset account"
+        right.add_paragraph("Keep this line")
+        # The generated table has no Section 4_1 content to anchor on, so point the finder at row 1
+        self.implementations._find_section_4_1_table_row = lambda *args: (0, 1)
+
+        # Part 1 strikes the whole sentence; Part 2 replaces part of it
+        part1 = {"right_box_analysis": {"has_deletion_marks": True, "deletion_details": [
+            {"should_delete": True, "item_text": "Moved funds to offset account", "deletion_type": "line_strike"}]}}
+        part2 = {"right_box_analysis": {"has_replacement_marks": True, "replacement_details": [
+            {"should_replace": True, "original_text": "offset account", "replacement_text": "savings"}]}}
+        changes = self.implementations.implement_section_4_1(doc, {"part1_data": part1, "part2_data": part2})
+
+        # The replacement is applied first, so the strike only succeeds by retrying with the replaced text
+        # (the struck text is removed from its paragraph, which is left empty)
+        combined = [change for change in changes if change.get("section") == "Section_4_1_Combined"]
+        return (self.check("Combined right box change recorded", len(combined), 1) and
+                self.check("Combined changes count", combined[0].get("changes_count"), 2) and
+                self.check("Right box paragraphs", [para.text for para in right.paragraphs if para.text], ["Keep this line"]))
+
+    def run_test(self) -> bool:
+        print(f"🧪 Section 4_1 two-part rules test")
+        results = []
+        for test in (self.test_strike_after_replacement,):
+            print(f"🔍 {test.__doc__}")
+            results.append(test())
+        passed = sum(results)
+        print(f"\n📊 {passed}/{len(results)} checks passed")
+        return passed == len(results)
+
+
+def main():
+    """Run Section 4_1 two-part rules test"""
+    tester = Section4_1PartsTester()
+    success = tester.run_test()
+    print(f"Section 4_1 two-part rules test {'completed successfully' if success else 'failed'}")
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Handwriting Append Matching Testing
+Runs the handwriting target matching used by the handwriting append rules on small generated
+texts (no PDF or GPT-4o analysis needed).
+
+- A repeated target word counts once per occurrence towards the 70% word match
+- The document paragraph index offers the same paragraphs as the word match
+- A note is appended to every paragraph holding its sentence, in the body and in table cells
+"""
+
+import os
+import sys
+from docx import Document
+
+# Import the Word processing module directly (the core package also loads the PDF/vision modules)
+core_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
+sys.path.insert(0, core_dir)
+
+from unified_section_implementations import UnifiedSectionImplementations
+
+
+class HandwritingAppendTester:
+    def __init__(self):
+        self.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "handwriting_append_test")
+        self.implementations = UnifiedSectionImplementations(os.path.join(self.output_dir, "base.docx"), self.output_dir)
+
+    def check(self, description: str, actual, expected) -> bool:
+        if actual == expected:
+            print(f"   ✅ {description}")
+            return True
+        print(f"   ❌ {description}: expected {expected!r}, got {actual!r}")
+        return False
+
+    def flexible_match(self, target: str, para: str) -> bool:
+        target_lower, para_lower = target.lower(), para.lower()
+        return self.implementations._flexible_text_match(target_lower, tuple(target_lower.split()), para_lower, frozenset(para_lower.split()))
+
+    def test_repeated_target_words(self) -> bool:
+        """A repeated target word counts once per occurrence towards the 70% word match"""
+        # 8 tokens, 5 distinct words: "the" is 4 of the tokens, so the paragraph holds 6/8 (75%) of the tokens
+        # although it has only 3/5 (60%) of the distinct words
+        target = "the loan and the fee the rate the"
+        return (self.check("Paragraph holding 75% of the tokens", self.flexible_match(target, "the loan agreement and the terms"), True) and
+                self.check("Paragraph holding 2/8 of the tokens", self.flexible_match(target, "loan and interest terms"), False))
+
+    def test_index_candidates(self) -> bool:
+        """The document paragraph index offers the same paragraphs as the word match"""
+        doc = Document()
+        doc.add_paragraph("unrelated text")
+        doc.add_paragraph("the loan agreement and the terms")
+        doc_paras = self.implementations._snapshot_document_paragraphs(doc)
+
+        # Only the second paragraph holds 6/8 of the tokens, counting each "the" it matches
+        target = "the loan and the fee the rate the"
+        return (self.check("Candidates for the repeated-word target", doc_paras.candidates(target, tuple(target.split())), [1]) and
+                self.check("Candidates for an exact phrase", doc_paras.candidates("unrelated", ("unrelated",)), [0]))
+
+    def test_append_everywhere(self) -> bool:
+        """A note is appended to every paragraph holding its sentence, in the body and in table cells"""
+        doc = Document()
+        body_para = doc.add_paragraph("The borrower must repay the loan.")
+        cell = doc.add_table(rows=1, cols=2).cell(0, 0)
+        cell.text = "The borrower must repay the loan"
+        analysis_data = {
+            "left_box_analysis": {
+                "has_interruptions": True,
+                "interrupted_items": [{
+                    "item_text": "The borrower must repay the loan",
+                    "interruption_type": "handwritten notes",
+                    "interruption_description": "Handwritten text: 'by June'",
+                    "should_delete": False
+                }]
+            }
+        }
+        changes = self.implementations._apply_handwriting_append_to_document(doc, analysis_data)
+        return (self.check("Changes reported", len(changes), 1) and
+                self.check("Body paragraph", body_para.text, "The borrower must repay the loan. by June") and
+                self.check("Table cell", cell.text, "The borrower must repay the loan. by June"))
+
+    def run_test(self) -> bool:
+        print(f"🧪 Handwriting append matching test")
+        results = []
+        for test in (self.test_repeated_target_words, self.test_index_candidates, self.test_append_everywhere):
+            print(f"🔍 {test.__doc__}")
+            results.append(test())
+        passed = sum(results)
+        print(f"\n📊 {passed}/{len(results)} checks passed")
+        return passed == len(results)
+
+
+def main():
+    """Run handwriting append matching test"""
+    tester = HandwritingAppendTester()
+    success = tester.run_test()
+    print(f"Handwriting append matching test {'completed successfully' if success else 'failed'}")
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
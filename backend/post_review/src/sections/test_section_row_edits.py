@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Section Row Edit Testing
+Runs the per-row box edit helpers on small generated Word tables (no PDF or GPT-4o analysis
+needed) and checks both the edited cells and the shared row paragraph index.
+
+- A Section 2_5 deletion in a merged cell removes the paragraph from every cell index
+- A malformed Section 2_5 item is skipped without stopping the other deletions
+- Missing rows, boxes and texts are reported as failures instead of raising
+- Individual deletions in both boxes are removed together and dropped from the shared row index
+"""
+
+import os
+import sys
+from docx import Document
+
+# Import the Word processing module directly (the core package also loads the PDF/vision modules)
+core_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
+sys.path.insert(0, core_dir)
+
+from unified_section_implementations import UnifiedSectionImplementations
+
+
+class SectionRowEditTester:
+    def __init__(self):
+        self.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "section_row_edits_test")
+        self.implementations = UnifiedSectionImplementations(os.path.join(self.output_dir, "base.docx"), self.output_dir)
+
+    def check(self, description: str, actual, expected) -> bool:
+        if actual == expected:
+            print(f"   ✅ {description}")
+            return True
+        print(f"   ❌ {description}: expected {expected!r}, got {actual!r}")
+        return False
+
+    def index_texts(self, para_index: dict, cell_idx: int) -> list:
+        return [entry[1] for entry in para_index[cell_idx]]
+
+    def test_merged_cell_deletion(self) -> bool:
+        """A Section 2_5 deletion in a merged cell removes the paragraph from every cell index"""
+        doc = Document()
+        table = doc.add_table(rows=1, cols=2)
+        merged = table.cell(0, 0).merge(table.cell(0, 1))
+        merged.paragraphs[0].text = "Sell the growth fund holdings"
+        merged.add_paragraph("Keep the balanced fund")
+        para_index = self.implementations._build_para_index(doc, 0, 0)
+
+        items = [{"should_delete": True, "item_text": "Sell the growth fund holdings"}]
+        deleted = self.implementations._delete_specific_dot_points_2_5(doc, 0, 0, 0, items, para_index)
+
+        # Both cell indexes show the same <w:tc>, so the deleted paragraph must be gone from both
+        return (self.check("Deleted count", deleted, 1) and
+                self.check("Left box index", self.index_texts(para_index, 0), ["Keep the balanced fund"]) and
+                self.check("Right box index", self.index_texts(para_index, 1), ["Keep the balanced fund"]))
+
+    def test_malformed_item_skipped(self) -> bool:
+        """A malformed Section 2_5 item is skipped without stopping the other deletions"""
+        doc = Document()
+        cell = doc.add_table(rows=1, cols=2).cell(0, 0)
+        cell.paragraphs[0].text = "Sell the growth fund holdings"
+        cell.add_paragraph("Keep the balanced fund")
+        para_index = self.implementations._build_para_index(doc, 0, 0)
+
+        items = [
+            {"should_delete": True, "item_text": None},
+            {"should_delete": True, "item_text": "Sell the growth fund holdings"}
+        ]
+        deleted = self.implementations._delete_specific_dot_points_2_5(doc, 0, 0, 0, items, para_index)
+        return (self.check("Deleted count", deleted, 1) and
+                self.check("Remaining paragraphs", [para.text for para in cell.paragraphs], ["Keep the balanced fund"]))
+
+    def test_missing_positions(self) -> bool:
+        """Missing rows, boxes and texts are reported as failures instead of raising"""
+        doc = Document()
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "The borrower must repay the loan."
+        append = self.implementations._append_handwriting_after_fullstop
+
+        return (self.check("Delete missing table", self.implementations._delete_table_row(doc, 1, 0), False) and
+                self.check("Delete missing row", self.implementations._delete_table_row(doc, 0, 3), False) and
+                self.check("Rows left", len(table.rows), 1) and
+                self.check("Append to missing row", append(doc, 0, 3, "left", "The borrower must repay the loan.", "by June"), False) and
+                self.check("Append with no original text", append(doc, 0, 0, "left", None, "by June"), False) and
+                self.check("Left box unchanged", table.cell(0, 0).text, "The borrower must repay the loan."))
+
+    def test_batched_box_deletions(self) -> bool:
+        """Individual deletions in both boxes are removed together and dropped from the shared row index"""
+        doc = Document()
+        table = doc.add_table(rows=1, cols=2)
+        left_cell, right_cell = table.cell(0, 0), table.cell(0, 1)
+        left_cell.paragraphs[0].text = "Sell the growth fund holdings"
+        left_cell.add_paragraph("Keep the balanced fund")
+        right_cell.paragraphs[0].text = "Buy the index fund units"
+        right_cell.add_paragraph("Keep the cash reserve")
+        para_index = self.implementations._build_para_index(doc, 0, 0)
+
+        analysis_data = {
+            "left_box_analysis": {
+                "has_deletion_marks": True,
+                "deletion_details": [{"should_delete": True, "item_text": "Sell the growth fund holdings"}]
+            },
+            "right_box_analysis": {
+                "has_deletion_marks": True,
+                "deletion_details": [{"should_delete": True, "item_text": "Buy the index fund units"}]
+            }
+        }
+        changes = self.implementations._apply_individual_deletions(doc, 0, 0, analysis_data, para_index=para_index)
+        return (self.check("Deleted per box", [(change["location"], change["deleted_count"]) for change in changes],
+                           [("left", 1), ("right", 1)]) and
+                self.check("Left box", [para.text for para in left_cell.paragraphs], ["Keep the balanced fund"]) and
+                self.check("Right box", [para.text for para in right_cell.paragraphs], ["Keep the cash reserve"]) and
+                self.check("Left box index", self.index_texts(para_index, 0), ["Keep the balanced fund"]) and
+                self.check("Right box index", self.index_texts(para_index, 1), ["Keep the cash reserve"]))
+
+    def run_test(self) -> bool:
+        print(f"🧪 Section row edit test")
+        results = []
+        for test in (self.test_merged_cell_deletion, self.test_malformed_item_skipped, self.test_missing_positions,
+                     self.test_batched_box_deletions):
+            print(f"🔍 {test.__doc__}")
+            results.append(test())
+        passed = sum(results)
+        print(f"\n📊 {passed}/{len(results)} checks passed")
+        return passed == len(results)
+
+
+def main():
+    """Run section row edit test"""
+    tester = SectionRowEditTester()
+    success = tester.run_test()
+    print(f"Section row edit test {'completed successfully' if success else 'failed'}")
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()